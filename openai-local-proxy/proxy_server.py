@@ -8,19 +8,24 @@ This enables zero-code-change migration of existing OpenAI applications to local
 """
 
 import asyncio
-import json
+import itertools
 import logging
+import os
+import sys
 import time
-from typing import Any, Dict, List, Optional, AsyncGenerator
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, FrozenSet, List, Mapping, Optional, AsyncGenerator, Tuple
 from pathlib import Path
 from contextlib import asynccontextmanager
 
 import httpx
+import orjson
 import yaml
 from fastapi import FastAPI, Request, Response, HTTPException, Header, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import StreamingResponse, JSONResponse
 from pydantic import BaseModel, Field
+from starlette.background import BackgroundTask
 import uvicorn
 
 
@@ -31,12 +36,35 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Pre-encoded SSE framing
+_SSE_PREFIX = b"data: "
+_SSE_SUFFIX = b"\n\n"
+_SSE_DONE = b"data: [DONE]\n\n"
+
+# Client headers that are passed on to the backend
+_FORWARD_HEADER_ALLOWLIST = frozenset({"content-type", "accept", "user-agent", "x-request-id"})
+
+# Backend status codes that count as overload for adaptive concurrency
+_OVERLOAD_STATUS_CODES = frozenset({429, 503})
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response serialized with orjson"""
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
+
+def default_worker_count() -> int:
+    """Half the available cores, but at least two worker processes"""
+    return max(2, (os.cpu_count() or 2) // 2)
+
 
 # Configuration Models
 class ServerConfig(BaseModel):
     host: str = "0.0.0.0"
     port: int = 8080
-    workers: int = 1
+    workers: int = Field(default_factory=default_worker_count)
     log_level: str = "info"
     cors_enabled: bool = True
     cors_origins: List[str] = ["*"]
@@ -49,6 +77,16 @@ class BackendConfig(BaseModel):
     timeout: int = 300
     max_retries: int = 3
     retry_delay: int = 1
+    http2: bool = True
+    connect_timeout: float = 5.0
+    pool_timeout: float = 5.0
+    max_keepalive_connections: int = 512
+    max_connections: int = 1024
+    keepalive_expiry: float = 60.0
+    max_concurrency: int = 4
+    min_concurrency: int = 1
+    adaptive_concurrency: bool = False
+    queue_timeout: Optional[float] = None
 
 
 class AuthConfig(BaseModel):
@@ -61,6 +99,13 @@ class LoggingConfig(BaseModel):
     format: str = "text"
     include_request_body: bool = False
     include_response_body: bool = False
+    # Log one in every N forwarded requests at INFO level
+    request_log_every: int = Field(1, ge=1)
+
+
+class ResponseConfig(BaseModel):
+    add_usage_stats: bool = True
+    normalize_format: bool = True
 
 
 class ProxyConfig(BaseModel):
@@ -70,6 +115,114 @@ class ProxyConfig(BaseModel):
     default_model: str = "llama-3.1-instruct-13b"
     authentication: AuthConfig = AuthConfig()
     logging: LoggingConfig = LoggingConfig()
+    response: ResponseConfig = ResponseConfig()
+
+
+class ConcurrencyLimiter:
+    """
+    Admission control for requests sent to the backend
+    
+    At most `limit` requests are in flight at once; the rest wait here instead
+    of piling up in the backend. In adaptive mode the limit follows AIMD like
+    TCP congestion control: it grows by one after a streak of `limit`
+    successful requests and halves when the overload rate (timeouts, 429s and
+    503s) over the last `window` requests reaches `overload_threshold`.
+    Waiting for a slot gives up after `acquire_timeout` seconds.
+    """
+    
+    def __init__(
+        self,
+        max_concurrency: int,
+        min_concurrency: int = 1,
+        adaptive: bool = False,
+        window: int = 20,
+        overload_threshold: float = 0.2,
+        acquire_timeout: Optional[float] = None
+    ):
+        self.max_concurrency = max(1, max_concurrency)
+        self.min_concurrency = max(1, min(min_concurrency, self.max_concurrency))
+        self.adaptive = adaptive
+        self.overload_threshold = overload_threshold
+        self.acquire_timeout = acquire_timeout
+        self.limit = self.max_concurrency
+        self._outcomes: Deque[bool] = deque(maxlen=window)
+        self._success_streak = 0
+        self._in_flight = 0
+        self._condition = asyncio.Condition()
+    
+    async def acquire(self) -> None:
+        """
+        Wait for a free slot
+        
+        Raises:
+            asyncio.TimeoutError: If no slot frees up within acquire_timeout
+        """
+        async with self._condition:
+            await asyncio.wait_for(
+                self._condition.wait_for(lambda: self._in_flight < self.limit),
+                self.acquire_timeout
+            )
+            self._in_flight += 1
+    
+    async def release(self, overloaded: bool = False) -> None:
+        """
+        Free a slot and record the outcome of the request
+        
+        Args:
+            overloaded: Whether the backend signalled overload
+        """
+        async with self._condition:
+            self._in_flight -= 1
+            if self.adaptive:
+                self._record(overloaded)
+            self._condition.notify_all()
+    
+    def _record(self, overloaded: bool) -> None:
+        self._outcomes.append(overloaded)
+        
+        if overloaded:
+            self._success_streak = 0
+            if sum(self._outcomes) / self._outcomes.maxlen >= self.overload_threshold:
+                # Multiplicative decrease
+                self.limit = max(self.min_concurrency, self.limit // 2)
+                self._outcomes.clear()
+            return
+        
+        # Additive increase
+        self._success_streak += 1
+        if self._success_streak >= self.limit and self.limit < self.max_concurrency:
+            self.limit += 1
+            self._success_streak = 0
+
+
+def build_limiter(backend: BackendConfig, workers: int = 1) -> ConcurrencyLimiter:
+    """
+    Create the concurrency limiter for a backend
+    
+    max_concurrency is a cap across all worker processes, so each worker
+    gets an equal share of it (but never less than min_concurrency).
+    
+    Args:
+        backend: Backend configuration
+        workers: Number of worker processes sharing the backend
+    
+    Returns:
+        Limiter for this worker
+    """
+    if backend.max_concurrency // max(1, workers) < 1:
+        logger.warning(
+            "max_concurrency %d is less than the %d workers; each worker still gets "
+            "%d slot(s), so up to %d requests may reach %s at once. Lower server.workers "
+            "or raise max_concurrency.",
+            backend.max_concurrency, workers, backend.min_concurrency,
+            backend.min_concurrency * workers, backend.name
+        )
+    return ConcurrencyLimiter(
+        max_concurrency=max(backend.min_concurrency, backend.max_concurrency // max(1, workers)),
+        min_concurrency=backend.min_concurrency,
+        adaptive=backend.adaptive_concurrency,
+        acquire_timeout=backend.queue_timeout
+    )
 
 
 # Load configuration
@@ -78,7 +231,7 @@ def load_config(config_path: str = "config.yaml") -> ProxyConfig:
     try:
         config_file = Path(config_path)
         if not config_file.exists():
-            logger.warning(f"Config file {config_path} not found, using defaults")
+            logger.warning("Config file %s not found, using defaults", config_path)
             return ProxyConfig(
                 server=ServerConfig(),
                 backends={
@@ -94,35 +247,119 @@ def load_config(config_path: str = "config.yaml") -> ProxyConfig:
         
         return ProxyConfig(**config_data)
     except Exception as e:
-        logger.error(f"Error loading config: {e}")
+        logger.error("Error loading config: %s", e)
         raise
 
 
-# Global configuration
-config = load_config()
+def build_model_maps(model_mapping: Dict[str, str]) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """
+    Build the forward and reverse model lookup tables
+
+    Several OpenAI names usually map onto the same local model, so the reverse
+    table keeps the first OpenAI name listed for each local model.
+
+    Args:
+        model_mapping: OpenAI -> local model name mapping from the config
+
+    Returns:
+        Tuple of (forward map, reverse map)
+    """
+    forward_map = dict(model_mapping)
+    reverse_map: Dict[str, str] = {}
+    for openai_name, local_name in model_mapping.items():
+        reverse_map.setdefault(local_name, openai_name)
+    return forward_map, reverse_map
+
+
+# Global configuration, loaded once per process (uvicorn workers each import
+# this module)
+config: ProxyConfig = load_config()
+
+# State derived from the configuration. These are placeholders (deny-all
+# authentication) until apply_config(config) below installs the real values.
+_FWD_MAP: Dict[str, str] = {}
+_REV_MAP: Dict[str, str] = {}
+_backend_limiter: ConcurrencyLimiter = ConcurrencyLimiter(max_concurrency=1)
+_HEALTH_BODY: bytes = b""
+_AUTH_ENABLED: bool = True
+_VALID_KEYS: FrozenSet[str] = frozenset()
 
 # Global HTTP client
 http_client: Optional[httpx.AsyncClient] = None
 
+# Bodyless methods supported by forward_request. Unbound client methods keep
+# the table valid whenever the global client is replaced.
+_METHOD_DISPATCH = {
+    "GET": httpx.AsyncClient.get,
+    "DELETE": httpx.AsyncClient.delete,
+}
+
+# Counts forwarded requests for log sampling
+_forward_log_counter = itertools.count()
+
+# Cached /v1/models listing as (monotonic fetch time, transformed body)
+MODELS_CACHE_TTL = 30.0
+_models_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+_models_lock = asyncio.Lock()
+
+
+def apply_config(new_config: ProxyConfig) -> None:
+    """
+    Install a configuration and rebuild everything derived from it
+    
+    Model names are interned so the lookup tables share one string object
+    per name. Call this again whenever the configuration is reloaded.
+    
+    Args:
+        new_config: Configuration to install
+    """
+    global config, _FWD_MAP, _REV_MAP, _backend_limiter, _HEALTH_BODY, _models_cache
+    global _AUTH_ENABLED, _VALID_KEYS
+    
+    new_config.model_mapping = {
+        sys.intern(k): sys.intern(v) for k, v in new_config.model_mapping.items()
+    }
+    config = new_config
+    _FWD_MAP, _REV_MAP = build_model_maps(config.model_mapping)
+    _backend_limiter = build_limiter(config.backends["primary"], config.server.workers)
+    _HEALTH_BODY = orjson.dumps({"status": "healthy", "backend": config.backends["primary"].url})
+    _AUTH_ENABLED = config.authentication.enabled
+    _VALID_KEYS = frozenset(config.authentication.valid_api_keys)
+    _models_cache = None
+
+
+apply_config(config)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage application lifespan - startup and shutdown"""
     global http_client
-    # Startup
+    # Startup: one long-lived client (and connection pool) per process
+    backend = config.backends["primary"]
     http_client = httpx.AsyncClient(
-        timeout=httpx.Timeout(config.backends["primary"].timeout),
-        limits=httpx.Limits(max_keepalive_connections=10, max_connections=100)
+        http2=backend.http2,
+        timeout=httpx.Timeout(
+            backend.timeout,
+            connect=backend.connect_timeout,
+            pool=backend.pool_timeout
+        ),
+        limits=httpx.Limits(
+            max_keepalive_connections=backend.max_keepalive_connections,
+            max_connections=backend.max_connections,
+            keepalive_expiry=backend.keepalive_expiry
+        )
     )
     logger.info("OpenAI Local Proxy started")
-    logger.info(f"Forwarding requests to: {config.backends['primary'].url}")
-    
-    yield
+    logger.info("Forwarding requests to: %s", backend.url)
     
-    # Shutdown
-    if http_client:
+    try:
+        yield
+    finally:
+        # Shutdown
         await http_client.aclose()
-    logger.info("OpenAI Local Proxy stopped")
+        http_client = None
+        logger.info("OpenAI Local Proxy stopped")
 
 
 # Initialize FastAPI app with lifespan
@@ -130,7 +367,8 @@ app = FastAPI(
     title="OpenAI Local Proxy",
     description="Local proxy for OpenAI API compatible with LM Studio and other local LLM backends",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 
@@ -157,13 +395,7 @@ def map_model_name(model: str, reverse: bool = False) -> str:
     Returns:
         Mapped model name
     """
-    if reverse:
-        # Reverse mapping (local -> OpenAI)
-        reverse_map = {v: k for k, v in config.model_mapping.items()}
-        return reverse_map.get(model, model)
-    else:
-        # Forward mapping (OpenAI -> local)
-        return config.model_mapping.get(model, model)
+    return (_REV_MAP if reverse else _FWD_MAP).get(model, model)
 
 
 def validate_api_key(authorization: Optional[str]) -> bool:
@@ -176,7 +408,7 @@ def validate_api_key(authorization: Optional[str]) -> bool:
     Returns:
         True if valid or authentication disabled, False otherwise
     """
-    if not config.authentication.enabled:
+    if not _AUTH_ENABLED:
         return True
     
     if not authorization:
@@ -185,7 +417,7 @@ def validate_api_key(authorization: Optional[str]) -> bool:
     # Extract Bearer token
     if authorization.startswith("Bearer "):
         token = authorization[7:]
-        return token in config.authentication.valid_api_keys
+        return token in _VALID_KEYS
     
     return False
 
@@ -194,81 +426,163 @@ def transform_request_body(body: Dict[str, Any]) -> Dict[str, Any]:
     """
     Transform OpenAI request to local backend format
     
+    Transfers ownership of body: it is modified in place and returned, so
+    callers must not rely on the original contents afterwards.
+    
     Args:
-        body: Original request body
+        body: Freshly parsed request body
     
     Returns:
-        Transformed request body
+        The same body, with the model name mapped
     """
-    transformed = body.copy()
-    
     # Map model name
-    if "model" in transformed:
-        transformed["model"] = map_model_name(transformed["model"])
+    if "model" not in body:
+        body["model"] = config.default_model
     else:
-        transformed["model"] = config.default_model
+        model = body["model"]
+        mapped = _FWD_MAP.get(model) if isinstance(model, str) else None
+        if mapped is not None and mapped != model:
+            body["model"] = mapped
     
     # Log transformation if enabled
-    if config.logging.include_request_body:
-        logger.debug(f"Transformed request: {json.dumps(transformed, indent=2)}")
+    if config.logging.include_request_body and logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Transformed request: %s", orjson.dumps(body, option=orjson.OPT_INDENT_2).decode())
     
-    return transformed
+    return body
 
 
 def transform_response_body(body: Dict[str, Any], original_model: str) -> Dict[str, Any]:
     """
     Transform local backend response to OpenAI format
     
+    Transfers ownership of body: it is modified in place and returned.
+    
     Args:
-        body: Backend response body
+        body: Freshly parsed backend response body
         original_model: Original OpenAI model name from request
     
     Returns:
-        Transformed response body
+        The same body, in OpenAI format
     """
-    transformed = body.copy()
-    
     # Map model name back to OpenAI format
-    if "model" in transformed:
-        transformed["model"] = original_model
+    if "model" in body:
+        body["model"] = original_model
     
     # Ensure required OpenAI fields exist
-    if "object" not in transformed:
-        if "choices" in transformed:
-            transformed["object"] = "chat.completion"
-    
-    if "created" not in transformed:
-        transformed["created"] = int(time.time())
+    if config.response.normalize_format:
+        if "object" not in body:
+            if "choices" in body:
+                body["object"] = "chat.completion"
+        
+        if "created" not in body:
+            body["created"] = int(time.time())
     
     # Add usage stats if missing
-    if "usage" not in transformed:
-        if "choices" in transformed and len(transformed["choices"]) > 0:
+    if config.response.add_usage_stats and "usage" not in body:
+        if "choices" in body and len(body["choices"]) > 0:
             # Estimate token usage (rough approximation)
             content = ""
-            if "message" in transformed["choices"][0]:
-                content = transformed["choices"][0]["message"].get("content", "")
-            elif "text" in transformed["choices"][0]:
-                content = transformed["choices"][0]["text"]
+            if "message" in body["choices"][0]:
+                content = body["choices"][0]["message"].get("content", "")
+            elif "text" in body["choices"][0]:
+                content = body["choices"][0]["text"]
             
-            tokens = len(content.split())  # Very rough estimate
-            transformed["usage"] = {
+            # Very rough estimate: ~4 characters per token
+            tokens = max(1, len(content) // 4) if content else 0
+            body["usage"] = {
                 "prompt_tokens": 0,
                 "completion_tokens": tokens,
                 "total_tokens": tokens
             }
     
     # Log transformation if enabled
-    if config.logging.include_response_body:
-        logger.debug(f"Transformed response: {json.dumps(transformed, indent=2)}")
+    if config.logging.include_response_body and logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Transformed response: %s", orjson.dumps(body, option=orjson.OPT_INDENT_2).decode())
     
-    return transformed
+    return body
+
+
+def log_forward(method: str, path: str, url: str) -> None:
+    """
+    Log a forwarded request, sampled by logging.request_log_every
+    
+    Args:
+        method: HTTP method
+        path: API endpoint path
+        url: Backend URL
+    """
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    if next(_forward_log_counter) % config.logging.request_log_every:
+        return
+    logger.info("Forwarding %s %s to %s", method, path, url)
+
+
+def build_forward_headers(headers: Optional[Mapping[str, str]]) -> Dict[str, str]:
+    """
+    Select the client headers that are passed on to the backend
+    
+    Args:
+        headers: Incoming request headers
+    
+    Returns:
+        Allowlisted headers (never authorization, host, cookies, ...)
+    """
+    return {
+        k: v for k, v in (headers or {}).items()
+        if k.lower() in _FORWARD_HEADER_ALLOWLIST
+    }
+
+
+async def send_to_backend(
+    url: str,
+    send: Callable[[], Awaitable[httpx.Response]],
+    hold_slot: bool = False
+) -> httpx.Response:
+    """
+    Send a request to the backend under admission control
+    
+    Args:
+        url: Backend URL, used for error reporting
+        send: Coroutine factory that performs the actual HTTP call
+        hold_slot: Keep the limiter slot after a successful send; the caller
+            must release it (see stream_backend_response)
+    
+    Returns:
+        Backend response
+    """
+    try:
+        await _backend_limiter.acquire()
+    except asyncio.TimeoutError:
+        logger.error("No backend slot free for %s", url)
+        raise HTTPException(status_code=503, detail="Backend busy")
+    
+    overloaded = False
+    release = True
+    
+    try:
+        response = await send()
+        overloaded = response.status_code in _OVERLOAD_STATUS_CODES
+        release = not hold_slot
+        return response
+    
+    except httpx.TimeoutException:
+        overloaded = True
+        logger.error("Timeout forwarding request to %s", url)
+        raise HTTPException(status_code=504, detail="Backend timeout")
+    except httpx.RequestError as e:
+        logger.error("Error forwarding request to %s: %s", url, e)
+        raise HTTPException(status_code=502, detail=f"Backend error: {str(e)}")
+    finally:
+        if release:
+            await _backend_limiter.release(overloaded)
 
 
 async def forward_request(
     method: str,
     path: str,
     body: Optional[Dict[str, Any]] = None,
-    headers: Optional[Dict[str, str]] = None,
+    headers: Optional[Mapping[str, str]] = None,
     stream: bool = False
 ) -> httpx.Response:
     """
@@ -279,114 +593,274 @@ async def forward_request(
         path: API endpoint path
         body: Request body
         headers: Request headers
-        stream: Whether to stream the response
+        stream: Whether to stream the response; the backend slot is then
+            held until stream_backend_response finishes the stream
     
     Returns:
         Backend response
     """
     backend_url = config.backends["primary"].url
     url = f"{backend_url}{path}"
+    forward_headers = build_forward_headers(headers)
     
-    # Remove authorization header when forwarding
-    forward_headers = headers.copy() if headers else {}
-    forward_headers.pop("authorization", None)
-    forward_headers.pop("Authorization", None)
-    
-    logger.info(f"Forwarding {method} {path} to {url}")
+    log_forward(method, path, url)
     
-    try:
-        if method == "GET":
-            response = await http_client.get(url, headers=forward_headers)
-        elif method == "POST":
-            if stream:
-                response = await http_client.post(
-                    url,
-                    json=body,
-                    headers=forward_headers,
-                    timeout=None  # No timeout for streaming
-                )
-            else:
-                response = await http_client.post(url, json=body, headers=forward_headers)
-        elif method == "DELETE":
-            response = await http_client.delete(url, headers=forward_headers)
-        else:
-            raise HTTPException(status_code=405, detail=f"Method {method} not supported")
+    if method == "POST":
+        # Serialize with orjson rather than letting httpx use the stdlib encoder
+        content = orjson.dumps(body) if body is not None else None
+        if content is not None:
+            forward_headers["content-type"] = "application/json"
         
-        return response
+        if stream:
+            # Send without reading the body; the caller owns the open response
+            backend_request = http_client.build_request(
+                "POST",
+                url,
+                content=content,
+                headers=forward_headers,
+                timeout=None  # No timeout for streaming
+            )
+            return await send_to_backend(
+                url,
+                lambda: http_client.send(backend_request, stream=True),
+                hold_slot=True
+            )
+        
+        return await send_to_backend(url, lambda: http_client.post(url, content=content, headers=forward_headers))
     
-    except httpx.TimeoutException:
-        logger.error(f"Timeout forwarding request to {url}")
-        raise HTTPException(status_code=504, detail="Backend timeout")
-    except httpx.RequestError as e:
-        logger.error(f"Error forwarding request to {url}: {e}")
-        raise HTTPException(status_code=502, detail=f"Backend error: {str(e)}")
+    send = _METHOD_DISPATCH.get(method)
+    if send is None:
+        raise HTTPException(status_code=405, detail=f"Method {method} not supported")
+    return await send_to_backend(url, lambda: send(http_client, url, headers=forward_headers))
+
+
+async def forward_request_raw(
+    method: str,
+    path: str,
+    content: Optional[bytes] = None,
+    headers: Optional[Mapping[str, str]] = None
+) -> httpx.Response:
+    """
+    Forward a request to the backend with its body passed through as bytes
+    
+    Args:
+        method: HTTP method
+        path: API endpoint path
+        content: Raw request body
+        headers: Request headers
+    
+    Returns:
+        Backend response
+    """
+    backend_url = config.backends["primary"].url
+    url = f"{backend_url}{path}"
+    forward_headers = build_forward_headers(headers)
+    
+    log_forward(method, path, url)
+    
+    return await send_to_backend(
+        url,
+        lambda: http_client.request(method, url, content=content, headers=forward_headers)
+    )
 
 
-async def stream_response(response: httpx.Response, original_model: str) -> AsyncGenerator[str, None]:
+async def stream_response(response: httpx.Response, original_model: str) -> AsyncGenerator[bytes, None]:
     """
     Stream response from backend, transforming each chunk
     
+    The body is split into SSE lines at the byte level. Frames are forwarded
+    verbatim unless they carry a model name that has to be rewritten.
+    
     Args:
-        response: Backend response
+        response: Backend response opened with stream=True
         original_model: Original OpenAI model name from request
     
     Yields:
         Transformed SSE chunks
     """
-    async for line in response.aiter_lines():
-        if not line.strip():
-            continue
-        
-        # Handle SSE format
-        if line.startswith("data: "):
-            data = line[6:]
-            
-            if data.strip() == "[DONE]":
-                yield f"data: [DONE]\n\n"
-                continue
-            
-            try:
-                chunk = json.loads(data)
-                # Transform model name in chunk
-                if "model" in chunk:
-                    chunk["model"] = original_model
-                
-                yield f"data: {json.dumps(chunk)}\n\n"
-            except json.JSONDecodeError:
-                # Pass through if not valid JSON
-                yield f"data: {data}\n\n"
+    buffer = b""
+    # No chunk_size: httpx would otherwise hold bytes back until it has that many
+    async for raw_chunk in response.aiter_bytes():
+        buffer += raw_chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            frame = transform_sse_line(line, original_model)
+            if frame is not None:
+                yield frame
+    
+    # Flush a final line that was not newline-terminated
+    frame = transform_sse_line(buffer, original_model)
+    if frame is not None:
+        yield frame
+
+
+def transform_sse_line(line: bytes, original_model: str) -> Optional[bytes]:
+    """
+    Transform a single SSE line from the backend
+    
+    Args:
+        line: Raw line without the trailing newline
+        original_model: Original OpenAI model name from request
+    
+    Returns:
+        SSE frame to send to the client, or None if the line is dropped
+    """
+    line = line.strip()
+    
+    # Handle SSE format
+    if not line.startswith(_SSE_PREFIX):
+        return None
+    
+    data = line[len(_SSE_PREFIX):]
+    
+    if data == b"[DONE]":
+        return _SSE_DONE
+    
+    # Only frames that mention a model need to be parsed and re-serialized
+    if b'"model"' not in data:
+        return _SSE_PREFIX + data + _SSE_SUFFIX
+    
+    try:
+        chunk = orjson.loads(data)
+    except orjson.JSONDecodeError:
+        # Pass through if not valid JSON
+        return _SSE_PREFIX + data + _SSE_SUFFIX
+    
+    # Transform model name in chunk
+    if isinstance(chunk, dict) and "model" in chunk:
+        chunk["model"] = original_model
+    
+    return _SSE_PREFIX + orjson.dumps(chunk) + _SSE_SUFFIX
+
+
+def build_json_response(response: httpx.Response, original_model: str) -> Response:
+    """
+    Build the client response for a non-streaming backend reply
+    
+    When the backend body already reports the requested model and carries
+    every field OpenAI clients expect, the raw bytes are passed through
+    without being parsed.
+    
+    Args:
+        response: Backend response
+        original_model: Original OpenAI model name from request
+    
+    Returns:
+        JSON response for the client
+    """
+    raw = response.content
+    
+    if (
+        original_model == map_model_name(original_model)
+        and (b'"usage"' in raw or not config.response.add_usage_stats)
+        and (
+            (b'"object"' in raw and b'"created"' in raw)
+            or not config.response.normalize_format
+        )
+    ):
+        return Response(content=raw, media_type="application/json", status_code=response.status_code)
+    
+    try:
+        body = orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        raise HTTPException(status_code=502, detail="Invalid JSON in backend response")
+    
+    transformed_response = transform_response_body(body, original_model)
+    return ORJSONResponse(content=transformed_response, status_code=response.status_code)
+
+
+async def stream_backend_response(response: httpx.Response, original_model: str) -> StreamingResponse:
+    """
+    Wrap an open streaming backend response for the client
+    
+    Takes over the backend slot held by forward_request(stream=True) and
+    frees it only once the stream has been relayed or abandoned.
+    
+    Args:
+        response: Backend response opened with stream=True
+        original_model: Original OpenAI model name from request
+    
+    Returns:
+        Streaming SSE response that closes the backend response when done
+    """
+    finished = False
+    
+    async def finish() -> None:
+        # Runs from the relay's finally and the background task; only once
+        nonlocal finished
+        if finished:
+            return
+        finished = True
+        try:
+            await response.aclose()
+        finally:
+            await _backend_limiter.release(response.status_code in _OVERLOAD_STATUS_CODES)
+    
+    if response.status_code != 200:
+        try:
+            await response.aread()
+        finally:
+            await finish()
+        raise HTTPException(status_code=response.status_code, detail=response.text)
+    
+    async def relay() -> AsyncGenerator[bytes, None]:
+        try:
+            async for frame in stream_response(response, original_model):
+                yield frame
+        finally:
+            await finish()
+    
+    return StreamingResponse(
+        relay(),
+        media_type="text/event-stream",
+        background=BackgroundTask(finish)
+    )
 
 
 # API Endpoints
 
-@app.get("/health")
+@app.get("/health", include_in_schema=False)
 async def health_check():
     """Health check endpoint"""
-    return {"status": "healthy", "backend": config.backends["primary"].url}
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 @app.get("/v1/models")
-async def list_models(authorization: Optional[str] = Header(None)):
+async def list_models(request: Request, authorization: Optional[str] = Header(None)):
     """List available models"""
     if not validate_api_key(authorization):
         raise HTTPException(status_code=401, detail="Invalid API key")
     
+    global _models_cache
+    
+    cached = _models_cache
+    if cached and time.monotonic() - cached[0] < MODELS_CACHE_TTL:
+        return cached[1]
+    
     try:
-        response = await forward_request("GET", "/v1/models", headers={"authorization": authorization or ""})
-        
-        if response.status_code == 200:
-            data = response.json()
-            # Transform model names in response
+        # Concurrent cache misses wait here for a single backend fetch
+        async with _models_lock:
+            cached = _models_cache
+            if cached and time.monotonic() - cached[0] < MODELS_CACHE_TTL:
+                return cached[1]
+            
+            response = await forward_request("GET", "/v1/models", headers=request.headers)
+            
+            if response.status_code != 200:
+                raise HTTPException(status_code=response.status_code, detail=response.text)
+            
+            data = orjson.loads(response.content)
+            # Transform model names once, before caching
             if "data" in data:
                 for model in data["data"]:
                     if "id" in model:
                         model["id"] = map_model_name(model["id"], reverse=True)
+            
+            _models_cache = (time.monotonic(), data)
             return data
-        else:
-            raise HTTPException(status_code=response.status_code, detail=response.text)
     
     except Exception as e:
-        logger.error(f"Error listing models: {e}")
+        logger.error("Error listing models: %s", e)
         # Fallback: return default model list
         return {
             "object": "list",
@@ -401,21 +875,38 @@ async def list_models(authorization: Optional[str] = Header(None)):
         }
 
 
-@app.post("/v1/chat/completions")
-async def chat_completions(request: Request, authorization: Optional[str] = Header(None)):
+async def _proxy_openai_endpoint(
+    request: Request,
+    authorization: Optional[str],
+    path: str,
+    default_model: str,
+    supports_stream: bool
+) -> Response:
     """
-    Handle chat completion requests
+    Proxy an OpenAI JSON endpoint to the backend
     
-    This is the CRITICAL endpoint used by the text-rpg-adventure game
+    Args:
+        request: Incoming request
+        authorization: Authorization header value
+        path: API endpoint path, forwarded unchanged
+        default_model: OpenAI model name reported when the request has none
+        supports_stream: Whether the endpoint honours "stream": true
+    
+    Returns:
+        Response for the client
     """
     if not validate_api_key(authorization):
         raise HTTPException(status_code=401, detail="Invalid API key")
     
+    # Parse request body
+    try:
+        body = orjson.loads(await request.body())
+    except orjson.JSONDecodeError:
+        raise HTTPException(status_code=400, detail="Invalid JSON in request body")
+    
     try:
-        # Parse request body
-        body = await request.json()
-        original_model = body.get("model", "gpt-3.5-turbo")
-        stream = body.get("stream", False)
+        original_model = body.get("model", default_model)
+        stream = supports_stream and body.get("stream", False)
         
         # Transform request
         transformed_body = transform_request_body(body)
@@ -423,102 +914,55 @@ async def chat_completions(request: Request, authorization: Optional[str] = Head
         # Forward request
         response = await forward_request(
             "POST",
-            "/v1/chat/completions",
+            path,
             body=transformed_body,
-            headers={"authorization": authorization or ""},
+            headers=request.headers,
             stream=stream
         )
         
         # Handle streaming response
         if stream:
-            return StreamingResponse(
-                stream_response(response, original_model),
-                media_type="text/event-stream"
-            )
+            return await stream_backend_response(response, original_model)
         
         # Handle non-streaming response
         if response.status_code == 200:
-            response_data = response.json()
-            transformed_response = transform_response_body(response_data, original_model)
-            return JSONResponse(content=transformed_response)
+            return build_json_response(response, original_model)
         else:
             raise HTTPException(status_code=response.status_code, detail=response.text)
     
-    except json.JSONDecodeError:
-        raise HTTPException(status_code=400, detail="Invalid JSON in request body")
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"Error in chat completions: {e}")
+        logger.error("Error in %s: %s", path, e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/v1/chat/completions")
+async def chat_completions(request: Request, authorization: Optional[str] = Header(None)):
+    """
+    Handle chat completion requests
+    
+    This is the CRITICAL endpoint used by the text-rpg-adventure game
+    """
+    return await _proxy_openai_endpoint(
+        request, authorization, "/v1/chat/completions", "gpt-3.5-turbo", supports_stream=True
+    )
+
+
 @app.post("/v1/completions")
 async def completions(request: Request, authorization: Optional[str] = Header(None)):
     """Handle text completion requests"""
-    if not validate_api_key(authorization):
-        raise HTTPException(status_code=401, detail="Invalid API key")
-    
-    try:
-        body = await request.json()
-        original_model = body.get("model", "text-davinci-003")
-        stream = body.get("stream", False)
-        
-        transformed_body = transform_request_body(body)
-        
-        response = await forward_request(
-            "POST",
-            "/v1/completions",
-            body=transformed_body,
-            headers={"authorization": authorization or ""},
-            stream=stream
-        )
-        
-        if stream:
-            return StreamingResponse(
-                stream_response(response, original_model),
-                media_type="text/event-stream"
-            )
-        
-        if response.status_code == 200:
-            response_data = response.json()
-            transformed_response = transform_response_body(response_data, original_model)
-            return JSONResponse(content=transformed_response)
-        else:
-            raise HTTPException(status_code=response.status_code, detail=response.text)
-    
-    except Exception as e:
-        logger.error(f"Error in completions: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return await _proxy_openai_endpoint(
+        request, authorization, "/v1/completions", "text-davinci-003", supports_stream=True
+    )
 
 
 @app.post("/v1/embeddings")
 async def embeddings(request: Request, authorization: Optional[str] = Header(None)):
     """Handle embedding requests"""
-    if not validate_api_key(authorization):
-        raise HTTPException(status_code=401, detail="Invalid API key")
-    
-    try:
-        body = await request.json()
-        original_model = body.get("model", "text-embedding-ada-002")
-        
-        transformed_body = transform_request_body(body)
-        
-        response = await forward_request(
-            "POST",
-            "/v1/embeddings",
-            body=transformed_body,
-            headers={"authorization": authorization or ""}
-        )
-        
-        if response.status_code == 200:
-            response_data = response.json()
-            transformed_response = transform_response_body(response_data, original_model)
-            return JSONResponse(content=transformed_response)
-        else:
-            raise HTTPException(status_code=response.status_code, detail=response.text)
-    
-    except Exception as e:
-        logger.error(f"Error in embeddings: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return await _proxy_openai_endpoint(
+        request, authorization, "/v1/embeddings", "text-embedding-ada-002", supports_stream=False
+    )
 
 
 # Catch-all for other endpoints
@@ -536,38 +980,45 @@ async def catch_all(request: Request, path: str, authorization: Optional[str] =
         method = request.method
         full_path = f"/{path}"
         
-        # Get request body if present
-        body = None
-        if method in ["POST", "PUT", "PATCH"]:
+        # Only parse the body when there is a model name to map
+        content = await request.body()
+        if b'"model"' in content:
             try:
-                body = await request.json()
-                if "model" in body:
-                    body = transform_request_body(body)
-            except:
-                pass
+                body = orjson.loads(content)
+            except orjson.JSONDecodeError:
+                body = None
+            if isinstance(body, dict) and "model" in body:
+                model = body["model"]
+                transform_request_body(body)
+                if body["model"] != model:
+                    content = orjson.dumps(body)
         
-        response = await forward_request(
+        response = await forward_request_raw(
             method,
             full_path,
-            body=body,
-            headers={"authorization": authorization or ""}
+            content=content or None,
+            headers=request.headers
         )
         
         if response.status_code == 200:
-            try:
-                return response.json()
-            except:
-                return Response(content=response.content, status_code=response.status_code)
+            return Response(
+                content=response.content,
+                status_code=response.status_code,
+                media_type=response.headers.get("content-type")
+            )
         else:
             raise HTTPException(status_code=response.status_code, detail=response.text)
     
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"Error in catch-all handler for {path}: {e}")
+        logger.error("Error in catch-all handler for %s: %s", path, e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 def main():
     """Run the proxy server"""
+    # uvicorn[standard] installs uvloop (except on Windows) and the default loop="auto" uses it
     uvicorn.run(
         "proxy_server:app",
         host=config.server.host,
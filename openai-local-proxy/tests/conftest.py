@@ -0,0 +1,14 @@
+"""
+Shared test fixtures
+"""
+
+import httpx
+import pytest
+
+
+@pytest.fixture
+def mock_backend():
+    """Factory for HTTP clients whose requests are answered by a handler"""
+    def build(handler):
+        return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return build
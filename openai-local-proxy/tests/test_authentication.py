@@ -0,0 +1,27 @@
+"""
+Tests for API key validation
+"""
+
+from proxy_server import apply_config, config, validate_api_key
+
+
+def test_authentication_disabled():
+    """Test any request is accepted when authentication is off"""
+    assert validate_api_key(None)
+
+
+def test_authentication_enabled():
+    """Test only configured Bearer keys are accepted"""
+    original = config.model_copy(deep=True)
+    enabled = config.model_copy(deep=True)
+    enabled.authentication.enabled = True
+    enabled.authentication.valid_api_keys = ["sk-one", "sk-two"]
+    
+    apply_config(enabled)
+    try:
+        assert validate_api_key("Bearer sk-two")
+        assert not validate_api_key("Bearer sk-three")
+        assert not validate_api_key("sk-one")
+        assert not validate_api_key(None)
+    finally:
+        apply_config(original)
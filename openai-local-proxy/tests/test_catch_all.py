@@ -0,0 +1,70 @@
+"""
+Tests for the catch-all forwarding route
+"""
+
+import json
+
+import pytest
+import httpx
+from httpx import AsyncClient, ASGITransport
+from unittest.mock import patch
+
+
+@pytest.mark.asyncio
+async def test_body_without_model_is_forwarded_verbatim(mock_backend):
+    """Test bodies without a model name reach the backend unchanged"""
+    from proxy_server import app
+    
+    raw_body = b'{"input":  ["a", "b"]}'
+    seen = {}
+    
+    def handler(request):
+        seen["method"] = request.method
+        seen["body"] = request.content
+        return httpx.Response(200, json={"ok": True})
+    
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        with patch("proxy_server.http_client", mock_backend(handler)):
+            response = await client.put(
+                "/v1/custom",
+                content=raw_body,
+                headers={"content-type": "application/json"}
+            )
+    
+    assert response.status_code == 200
+    assert response.json() == {"ok": True}
+    assert seen == {"method": "PUT", "body": raw_body}
+
+
+@pytest.mark.asyncio
+async def test_body_with_model_is_mapped(mock_backend):
+    """Test model names in forwarded bodies are mapped to local names"""
+    from proxy_server import app
+    
+    seen = {}
+    
+    def handler(request):
+        seen.update(json.loads(request.content))
+        return httpx.Response(200, json={"ok": True})
+    
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        with patch("proxy_server.http_client", mock_backend(handler)):
+            response = await client.post("/v1/moderations", json={"model": "gpt-4", "input": "hi"})
+    
+    assert response.status_code == 200
+    assert seen == {"model": "llama-3.1-instruct-13b", "input": "hi"}
+
+
+@pytest.mark.asyncio
+async def test_backend_error_status_is_passed_through(mock_backend):
+    """Test backend error statuses are reported as-is rather than as 500"""
+    from proxy_server import app
+    
+    def handler(request):
+        return httpx.Response(404, content=b"no such endpoint")
+    
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        with patch("proxy_server.http_client", mock_backend(handler)):
+            response = await client.get("/v1/unknown")
+    
+    assert response.status_code == 404
@@ -4,21 +4,20 @@ Tests for chat completions endpoint
 
 import pytest
 import json
-from httpx import AsyncClient
-from unittest.mock import patch, AsyncMock
+import httpx
+from httpx import AsyncClient, ASGITransport
+from unittest.mock import patch
 
 
 @pytest.mark.asyncio
-async def test_chat_completion_basic():
+async def test_chat_completion_basic(mock_backend):
     """Test basic chat completion request"""
     from proxy_server import app
     
-    async with AsyncClient(app=app, base_url="http://test") as client:
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
         # Mock the backend response
-        with patch("proxy_server.http_client") as mock_client:
-            mock_response = AsyncMock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {
+        def handler(request):
+            return httpx.Response(200, json={
                 "id": "chatcmpl-123",
                 "object": "chat.completion",
                 "created": 1677652288,
@@ -36,9 +35,9 @@ async def test_chat_completion_basic():
                     "completion_tokens": 9,
                     "total_tokens": 19
                 }
-            }
-            mock_client.post.return_value = mock_response
-            
+            })
+        
+        with patch("proxy_server.http_client", mock_backend(handler)):
             response = await client.post(
                 "/v1/chat/completions",
                 json={
@@ -58,33 +57,35 @@ async def test_chat_completion_basic():
 
 
 @pytest.mark.asyncio
-async def test_chat_completion_with_stream():
+async def test_chat_completion_with_stream(mock_backend):
     """Test streaming chat completion request"""
     from proxy_server import app
     
-    async with AsyncClient(app=app, base_url="http://test") as client:
-        with patch("proxy_server.http_client") as mock_client:
-            # Mock streaming response
-            mock_response = AsyncMock()
-            mock_response.status_code = 200
-            
-            async def mock_iter_lines():
-                yield "data: " + json.dumps({
-                    "id": "chatcmpl-123",
-                    "object": "chat.completion.chunk",
-                    "created": 1677652288,
-                    "model": "llama-3.1-instruct-13b",
-                    "choices": [{
-                        "index": 0,
-                        "delta": {"content": "Hello"},
-                        "finish_reason": None
-                    }]
-                })
-                yield "data: [DONE]"
-            
-            mock_response.aiter_lines = mock_iter_lines
-            mock_client.post.return_value = mock_response
-            
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        # Mock streaming response
+        sse_body = (
+            "data: " + json.dumps({
+                "id": "chatcmpl-123",
+                "object": "chat.completion.chunk",
+                "created": 1677652288,
+                "model": "llama-3.1-instruct-13b",
+                "choices": [{
+                    "index": 0,
+                    "delta": {"content": "Hello"},
+                    "finish_reason": None
+                }]
+            }) + "\n\n"
+            "data: [DONE]\n\n"
+        )
+        
+        def handler(request):
+            return httpx.Response(
+                200,
+                content=sse_body.encode(),
+                headers={"content-type": "text/event-stream"}
+            )
+        
+        with patch("proxy_server.http_client", mock_backend(handler)):
             response = await client.post(
                 "/v1/chat/completions",
                 json={
@@ -96,18 +97,20 @@ async def test_chat_completion_with_stream():
             
             assert response.status_code == 200
             assert "text/event-stream" in response.headers.get("content-type", "")
+            
+            frames = [line for line in response.text.split("\n") if line]
+            assert json.loads(frames[0][6:])["model"] == "gpt-3.5-turbo"
+            assert frames[-1] == "data: [DONE]"
 
 
 @pytest.mark.asyncio
-async def test_chat_completion_with_parameters():
+async def test_chat_completion_with_parameters(mock_backend):
     """Test chat completion with various parameters"""
     from proxy_server import app
     
-    async with AsyncClient(app=app, base_url="http://test") as client:
-        with patch("proxy_server.http_client") as mock_client:
-            mock_response = AsyncMock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        def handler(request):
+            return httpx.Response(200, json={
                 "id": "chatcmpl-123",
                 "object": "chat.completion",
                 "created": 1677652288,
@@ -125,9 +128,9 @@ async def test_chat_completion_with_parameters():
                     "completion_tokens": 5,
                     "total_tokens": 15
                 }
-            }
-            mock_client.post.return_value = mock_response
-            
+            })
+        
+        with patch("proxy_server.http_client", mock_backend(handler)):
             response = await client.post(
                 "/v1/chat/completions",
                 json={
@@ -154,7 +157,7 @@ async def test_chat_completion_invalid_request():
     """Test chat completion with invalid request"""
     from proxy_server import app
     
-    async with AsyncClient(app=app, base_url="http://test") as client:
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
         # Missing messages field
         response = await client.post(
             "/v1/chat/completions",
@@ -166,3 +169,191 @@ async def test_chat_completion_invalid_request():
         # Should still forward and let backend handle validation
         # or return error
         assert response.status_code in [400, 422, 500]
+
+
+@pytest.mark.asyncio
+async def test_chat_completion_passthrough_unmapped_model(mock_backend):
+    """Test complete responses for unmapped models are forwarded byte-for-byte"""
+    from proxy_server import app
+    
+    backend_body = json.dumps({
+        "id": "chatcmpl-123",
+        "object": "chat.completion",
+        "created": 1677652288,
+        "model": "llama-3.1-instruct-13b",
+        "choices": [{
+            "index": 0,
+            "message": {"role": "assistant", "content": "Hi"},
+            "finish_reason": "stop"
+        }],
+        "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2}
+    }, indent=2).encode()
+    
+    def handler(request):
+        return httpx.Response(200, content=backend_body)
+    
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        with patch("proxy_server.http_client", mock_backend(handler)):
+            response = await client.post(
+                "/v1/chat/completions",
+                json={
+                    "model": "llama-3.1-instruct-13b",
+                    "messages": [{"role": "user", "content": "Hello"}]
+                }
+            )
+            
+            assert response.status_code == 200
+            assert response.content == backend_body
+
+
+@pytest.mark.asyncio
+async def test_chat_completion_forwards_allowlisted_headers_only(mock_backend):
+    """Test credentials and cookies are not forwarded to the backend"""
+    from proxy_server import app
+    
+    seen = {}
+    
+    def handler(request):
+        seen.update(request.headers)
+        return httpx.Response(200, json={
+            "object": "chat.completion",
+            "created": 1677652288,
+            "model": "llama-3.1-instruct-13b",
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": "Hi"}}],
+            "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2}
+        })
+    
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        with patch("proxy_server.http_client", mock_backend(handler)):
+            response = await client.post(
+                "/v1/chat/completions",
+                json={"model": "gpt-3.5-turbo", "messages": [{"role": "user", "content": "Hello"}]},
+                headers={
+                    "Authorization": "Bearer sk-secret",
+                    "Cookie": "session=abc",
+                    "X-Request-ID": "req-42"
+                }
+            )
+    
+    assert response.status_code == 200
+    assert seen["x-request-id"] == "req-42"
+    assert "authorization" not in seen
+    assert "cookie" not in seen
+
+
+@pytest.mark.asyncio
+async def test_stream_holds_backend_slot_until_finished(mock_backend):
+    """Test a streamed response keeps its backend slot while it is relayed"""
+    import proxy_server
+    from proxy_server import app
+    
+    in_flight = []
+    
+    async def sse_frames():
+        in_flight.append(proxy_server._backend_limiter._in_flight)
+        yield b'data: {"choices": [{"delta": {"content": "Hi"}}]}\n\n'
+        in_flight.append(proxy_server._backend_limiter._in_flight)
+        yield b"data: [DONE]\n\n"
+    
+    def handler(request):
+        return httpx.Response(200, content=sse_frames(), headers={"content-type": "text/event-stream"})
+    
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        with patch("proxy_server.http_client", mock_backend(handler)):
+            response = await client.post(
+                "/v1/chat/completions",
+                json={"model": "gpt-3.5-turbo", "messages": [], "stream": True}
+            )
+    
+    assert response.status_code == 200
+    assert response.text.endswith("data: [DONE]\n\n")
+    assert in_flight == [1, 1]
+    assert proxy_server._backend_limiter._in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_stream_error_releases_backend_slot(mock_backend):
+    """Test a non-200 streamed reply frees its backend slot"""
+    import proxy_server
+    from proxy_server import app
+    
+    def handler(request):
+        return httpx.Response(503, content=b"busy")
+    
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        with patch("proxy_server.http_client", mock_backend(handler)):
+            response = await client.post(
+                "/v1/chat/completions",
+                json={"model": "gpt-3.5-turbo", "messages": [], "stream": True}
+            )
+    
+    assert response.status_code != 200
+    assert proxy_server._backend_limiter._in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_invalid_request_json_is_client_error():
+    """Test a malformed request body is rejected with 400"""
+    from proxy_server import app
+    
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post(
+            "/v1/chat/completions",
+            content=b"{not json",
+            headers={"content-type": "application/json"}
+        )
+    
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_invalid_backend_json_is_bad_gateway(mock_backend):
+    """Test a non-JSON backend reply is reported as 502, not a client error"""
+    from proxy_server import app
+    
+    def handler(request):
+        return httpx.Response(200, content=b"<html>oops</html>")
+    
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        with patch("proxy_server.http_client", mock_backend(handler)):
+            response = await client.post(
+                "/v1/embeddings",
+                json={"model": "text-embedding-ada-002", "input": "hi"}
+            )
+    
+    assert response.status_code == 502
+
+
+@pytest.mark.asyncio
+async def test_stream_relays_frames_as_they_arrive(mock_backend):
+    """Test each SSE frame is relayed before the backend finishes the stream"""
+    import asyncio
+    from proxy_server import stream_response
+    
+    backend_done = False
+    
+    async def sse_frames():
+        nonlocal backend_done
+        yield b'data: {"choices": [{"delta": {"content": "Hi"}}]}\n\n'
+        await asyncio.sleep(0.05)
+        yield b'data: {"choices": [{"delta": {"content": " there"}}]}\n\n'
+        await asyncio.sleep(0.05)
+        yield b"data: [DONE]\n\n"
+        backend_done = True
+    
+    def handler(request):
+        return httpx.Response(200, content=sse_frames(), headers={"content-type": "text/event-stream"})
+    
+    client = mock_backend(handler)
+    response = await client.send(client.build_request("POST", "http://backend/v1/chat/completions"), stream=True)
+    
+    frames = []
+    done_when_received = []
+    async for frame in stream_response(response, "gpt-3.5-turbo"):
+        frames.append(frame)
+        done_when_received.append(backend_done)
+    await response.aclose()
+    
+    assert len(frames) == 3
+    assert frames[-1] == b"data: [DONE]\n\n"
+    assert done_when_received[:2] == [False, False]
@@ -0,0 +1,99 @@
+"""
+Tests for backend admission control
+"""
+
+import asyncio
+
+import pytest
+
+from proxy_server import BackendConfig, ConcurrencyLimiter, build_limiter
+
+
+@pytest.mark.asyncio
+async def test_limits_in_flight_requests():
+    """Test requests beyond the limit wait for a free slot"""
+    limiter = ConcurrencyLimiter(max_concurrency=1)
+    await limiter.acquire()
+    
+    waiter = asyncio.ensure_future(limiter.acquire())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+    
+    await limiter.release()
+    await asyncio.wait_for(waiter, timeout=1)
+    await limiter.release()
+
+
+@pytest.mark.asyncio
+async def test_adaptive_limit_decreases_on_overload():
+    """Test the limit halves once the overload rate crosses the threshold"""
+    limiter = ConcurrencyLimiter(max_concurrency=8, min_concurrency=2, adaptive=True, window=10)
+    
+    for _ in range(2):
+        await limiter.acquire()
+        await limiter.release(overloaded=True)
+    
+    assert limiter.limit == 4
+    
+    for _ in range(10):
+        await limiter.acquire()
+        await limiter.release(overloaded=True)
+    
+    assert limiter.limit == 2
+
+
+@pytest.mark.asyncio
+async def test_adaptive_limit_recovers_on_success():
+    """Test the limit grows back by one after a success streak"""
+    limiter = ConcurrencyLimiter(max_concurrency=4, adaptive=True, window=10)
+    limiter.limit = 2
+    
+    for _ in range(2):
+        await limiter.acquire()
+        await limiter.release()
+    
+    assert limiter.limit == 3
+
+
+@pytest.mark.asyncio
+async def test_acquire_times_out():
+    """Test waiting for a slot gives up after acquire_timeout"""
+    limiter = ConcurrencyLimiter(max_concurrency=1, acquire_timeout=0.01)
+    await limiter.acquire()
+    
+    with pytest.raises(asyncio.TimeoutError):
+        await limiter.acquire()
+    
+    await limiter.release()
+    await limiter.acquire()
+
+
+def test_build_limiter_splits_limit_across_workers():
+    """Test max_concurrency is shared between worker processes"""
+    backend = BackendConfig(name="test", url="http://backend", max_concurrency=8, min_concurrency=1)
+    
+    assert build_limiter(backend, workers=1).limit == 8
+    assert build_limiter(backend, workers=4).limit == 2
+    assert build_limiter(backend, workers=16).limit == 1
+
+
+def test_build_limiter_waits_without_queue_timeout():
+    """Test queued requests wait indefinitely unless queue_timeout is set"""
+    backend = BackendConfig(name="test", url="http://backend")
+    
+    assert build_limiter(backend).acquire_timeout is None
+    assert build_limiter(backend.model_copy(update={"queue_timeout": 30.0})).acquire_timeout == 30.0
+
+
+def test_build_limiter_warns_when_workers_exceed_limit(caplog):
+    """Test a warning is logged when the per-worker share rounds down to zero"""
+    backend = BackendConfig(name="test", url="http://backend", max_concurrency=2)
+    
+    with caplog.at_level("WARNING", logger="proxy_server"):
+        build_limiter(backend, workers=2)
+    assert not caplog.records
+    
+    with caplog.at_level("WARNING", logger="proxy_server"):
+        limiter = build_limiter(backend, workers=4)
+    assert limiter.limit == 1
+    assert "max_concurrency 2 is less than the 4 workers" in caplog.text
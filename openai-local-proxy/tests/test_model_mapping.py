@@ -3,7 +3,7 @@ Tests for model mapping functionality
 """
 
 import pytest
-from proxy_server import map_model_name, load_config
+from proxy_server import map_model_name, load_config, build_model_maps, transform_request_body
 
 
 def test_forward_model_mapping():
@@ -36,6 +36,19 @@ def test_model_mapping_bidirectional():
     assert mapped_back in ["gpt-3.5-turbo", "gpt-4", "gpt-4-turbo", "gpt-4-turbo-preview"]
 
 
+def test_build_model_maps():
+    """Test precomputed forward and reverse lookup tables"""
+    forward_map, reverse_map = build_model_maps({
+        "gpt-4": "local-a",
+        "gpt-4o": "local-a",
+        "gpt-3.5-turbo": "local-b",
+    })
+
+    assert forward_map["gpt-4o"] == "local-a"
+    # First OpenAI name listed wins for the reverse direction
+    assert reverse_map == {"local-a": "gpt-4", "local-b": "gpt-3.5-turbo"}
+
+
 def test_config_loading():
     """Test configuration loading"""
     config = load_config("config.yaml")
@@ -45,3 +58,18 @@ def test_config_loading():
     assert config.backends["primary"].url == "http://10.50.10.14:1234"
     assert len(config.model_mapping) > 0
     assert "gpt-3.5-turbo" in config.model_mapping
+
+
+def test_transform_request_body_leaves_unmapped_model():
+    """Test unmapped models pass through unchanged"""
+    body = {"model": "some-random-model", "messages": []}
+    assert transform_request_body(body) == {"model": "some-random-model", "messages": []}
+
+
+def test_transform_request_body_maps_model_in_place():
+    """Test mapped and missing models are rewritten in the given body"""
+    body = {"model": "gpt-4", "messages": []}
+    
+    assert transform_request_body(body) is body
+    assert body["model"] == "llama-3.1-instruct-13b"
+    assert transform_request_body({"messages": []})["model"] == "llama-3.1-instruct-13b"
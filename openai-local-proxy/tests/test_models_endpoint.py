@@ -0,0 +1,47 @@
+"""
+Tests for the models and health endpoints
+"""
+
+import pytest
+import httpx
+from httpx import AsyncClient, ASGITransport
+from unittest.mock import patch
+
+
+@pytest.mark.asyncio
+async def test_list_models_is_cached(mock_backend):
+    """Test repeated model listings are served from the cache"""
+    from proxy_server import app
+    
+    calls = []
+    
+    def handler(request):
+        calls.append(request.url.path)
+        return httpx.Response(200, json={
+            "object": "list",
+            "data": [{"id": "llama-3.1-instruct-13b", "object": "model", "owned_by": "local"}]
+        })
+    
+    backend = mock_backend(handler)
+    
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        with patch("proxy_server.http_client", backend), patch("proxy_server._models_cache", None):
+            first = await client.get("/v1/models")
+            second = await client.get("/v1/models")
+    
+    assert first.status_code == 200
+    assert first.json()["data"][0]["id"] == "gpt-3.5-turbo"
+    assert second.json() == first.json()
+    assert calls == ["/v1/models"]
+
+
+@pytest.mark.asyncio
+async def test_health_check():
+    """Test the health endpoint reports the primary backend"""
+    from proxy_server import app, config
+    
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/health")
+    
+    assert response.status_code == 200
+    assert response.json() == {"status": "healthy", "backend": config.backends["primary"].url}
@@ -0,0 +1,65 @@
+"""
+Tests for backend response transformation
+"""
+
+from unittest.mock import patch
+
+from proxy_server import transform_response_body, ResponseConfig
+
+
+def make_backend_body():
+    return {
+        "id": "chatcmpl-123",
+        "model": "llama-3.1-instruct-13b",
+        "choices": [{
+            "index": 0,
+            "message": {"role": "assistant", "content": "The quick brown fox"},
+            "finish_reason": "stop"
+        }]
+    }
+
+
+def test_fills_missing_openai_fields():
+    """Test model, object, created and usage are filled in"""
+    transformed = transform_response_body(make_backend_body(), "gpt-3.5-turbo")
+    
+    assert transformed["model"] == "gpt-3.5-turbo"
+    assert transformed["object"] == "chat.completion"
+    assert isinstance(transformed["created"], int)
+    assert transformed["usage"]["completion_tokens"] == 4
+
+
+def test_usage_stats_disabled():
+    """Test usage estimation is skipped when add_usage_stats is off"""
+    with patch("proxy_server.config.response", ResponseConfig(add_usage_stats=False)):
+        transformed = transform_response_body(make_backend_body(), "gpt-3.5-turbo")
+    
+    assert "usage" not in transformed
+
+
+def estimate_completion_tokens(message):
+    body = {"model": "llama-3.1-instruct-13b", "choices": [{"index": 0, "message": message}]}
+    return transform_response_body(body, "gpt-3.5-turbo")["usage"]["completion_tokens"]
+
+
+def test_usage_estimate_counts_characters():
+    """Test the estimate follows ~4 characters per token, not word count"""
+    assert estimate_completion_tokens({"role": "assistant", "content": "x" * 400}) == 100
+    assert estimate_completion_tokens({"role": "assistant", "content": "a,b"}) == 1
+    assert estimate_completion_tokens({"role": "assistant", "content": "ab"}) == 1
+
+
+def test_usage_estimate_empty_content():
+    """Test empty and missing (tool call) content count as zero tokens"""
+    assert estimate_completion_tokens({"role": "assistant", "content": ""}) == 0
+    assert estimate_completion_tokens({"role": "assistant", "content": None, "tool_calls": []}) == 0
+
+
+def test_normalize_format_disabled():
+    """Test object and created are left alone when normalize_format is off"""
+    with patch("proxy_server.config.response", ResponseConfig(normalize_format=False)):
+        transformed = transform_response_body(make_backend_body(), "gpt-3.5-turbo")
+    
+    assert transformed["model"] == "gpt-3.5-turbo"
+    assert "object" not in transformed
+    assert "created" not in transformed